@@ -16,15 +16,30 @@ del proceso de implementación y despliegue (Capítulo 4).
 """
 
 import os
-import glob
 import csv
-from typing import List, Dict, Optional
+import gzip
+import zlib
+import json
+import re
+import sys
+import io
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard es opcional: sin él no se leen archivos .zst
+    zstandard = None
 
 # Carpeta donde se almacenan las configuraciones
 CONFIG_DIR = "."
 
 # Extensiones de archivos de configuración a considerar
-EXTENSIONS = (".cfg", ".conf", ".txt", "")  # "" por si no tienen extensión
+EXTENSIONS = frozenset((".cfg", ".conf", ".txt", ""))  # "" por si no tienen extensión
 
 # Ignorar o no comentarios al contar las líneas
 IGNORE_COMMENTS = True
@@ -32,11 +47,49 @@ IGNORE_COMMENTS = True
 # Prefijos típicos de comentarios en configuraciones de red
 COMMENT_PREFIXES = ("#", "!", "//")
 
+# Salto de línea seguido de una línea de código: espacios opcionales (los mismos
+# que quita str.strip(), salvo el salto de línea) y un carácter visible que no
+# comience un comentario si IGNORE_COMMENTS está activo. Equivale a es_linea_valida
+# aplicada a cada línea, pero todas se cuentan con una sola búsqueda sobre el texto
+# precedido de "\n"; empezar en el salto permite al motor saltar entre líneas.
+_PATRON_LINEA_VALIDA = re.compile(
+    r"\n(?=[^\S\n]*"
+    + ("(?!" + "|".join(map(re.escape, COMMENT_PREFIXES)) + ")" if IGNORE_COMMENTS else "")
+    + r"\S)"
+)
+
 
 # Palabra clave para tomar un archivo como "referencia" (ej. MPLS tradicional)
 # Si no se encuentra ninguno, simplemente no se calcularán métricas de referencia.
 REFERENCIA_KEYWORD = "mpls"   # ej: "pe1-mpls.txt" será referencia
 
+# Nombre de referencia: contiene REFERENCIA_KEYWORD y no contiene "srv" (sin distinguir mayúsculas)
+_PATRON_REFERENCIA = re.compile(rf"^(?=.*{re.escape(REFERENCIA_KEYWORD)})(?!.*srv)", re.IGNORECASE | re.DOTALL)
+
+# Tamaño de bloque al leer archivos como flujo (comprimidos o muy grandes)
+TAM_BLOQUE = 1 << 20
+
+# Archivos sin comprimir mayores a este tamaño se leen por bloques en lugar de
+# leerse completos, para que la memoria usada no dependa del tamaño del archivo
+MAX_TAM_LECTURA = 64 * 1024 * 1024
+
+# Tamaño del búfer de escritura del CSV
+TAM_BUFFER_CSV = 1 << 20
+
+# Número máximo de hilos para contar archivos. Solo la lectura y la descompresión
+# liberan el GIL; la decodificación y la búsqueda de líneas no, así que con los
+# archivos ya en la caché del sistema los hilos no aceleran el conteo.
+MAX_WORKERS = 32
+
+# Caché de conteos entre ejecuciones: ruta -> [mtime_ns, tamaño, líneas].
+# Un archivo solo se vuelve a leer si cambió su fecha de modificación o su tamaño.
+_CACHE_PATH = os.path.join(CONFIG_DIR, ".line_counts_cache.json")
+
+# Versión de las reglas de conteo, incluida en la firma de la caché. Debe
+# incrementarse cada vez que contar_lineas_config cambie el resultado para un
+# mismo archivo, para que no se reutilicen conteos de una versión anterior.
+VERSION_CONTEO = 1
+
 
 def es_linea_valida(linea: str) -> bool:
     """
@@ -59,159 +112,321 @@ def es_linea_valida(linea: str) -> bool:
     return True
 
 
-def contar_lineas_config(ruta_archivo: str) -> int:
+def _abrir_zst(ruta_archivo: str):
     """
-    Cuenta el número de líneas válidas (líneas de código) en un archivo de configuración.
+    Abre un archivo comprimido con Zstandard como flujo de bytes descomprimidos.
+    """
+    f = open(ruta_archivo, "rb")
+    try:
+        # El lector cierra 'f' al cerrarse; si no llega a crearse, se cierra aquí
+        return zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+    except BaseException:
+        f.close()
+        raise
+
+
+# Archivos comprimidos admitidos: sufijo -> función que los abre como flujo binario.
+# Se reconocen como configuración si, sin el sufijo, su extensión está en EXTENSIONS
+# (ej. 'pe1-srv6.gz' o 'pe1-mpls.cfg.zst').
+DESCOMPRESORES = {".gz": gzip.open}
+if zstandard is not None:
+    DESCOMPRESORES[".zst"] = _abrir_zst
+
+# Errores de un archivo comprimido dañado, truncado o que no está realmente comprimido.
+# Otros errores de lectura (permisos, archivo borrado) interrumpen el análisis
+# igual que en los archivos sin comprimir.
+ERRORES_DESCOMPRESION = (gzip.BadGzipFile, EOFError, zlib.error)
+if zstandard is not None:
+    ERRORES_DESCOMPRESION += (zstandard.ZstdError,)
+
+
+def _contar_lineas_flujo(f) -> int:
+    """
+    Cuenta las líneas válidas de un flujo de texto leyendo bloques de TAM_BLOQUE
+    caracteres. Cada bloque se analiza hasta su último salto de línea; el resto
+    (ese salto y una línea incompleta) se antepone al bloque siguiente.
     """
     contador = 0
+    resto = "\n"
+    while bloque := f.read(TAM_BLOQUE):
+        datos = resto + bloque
+        corte = datos.rfind("\n")
+        contador += len(_PATRON_LINEA_VALIDA.findall(datos, 0, corte))
+        resto = datos[corte:]
+    return contador + len(_PATRON_LINEA_VALIDA.findall(resto))
+
+
+def contar_lineas_config(ruta_archivo: str) -> Optional[int]:
+    """
+    Cuenta el número de líneas válidas (líneas de código) en un archivo de configuración.
+
+    El archivo se lee completo y las líneas se cuentan con una única búsqueda
+    de _PATRON_LINEA_VALIDA. Los archivos comprimidos (ver DESCOMPRESORES) y
+    los que superan MAX_TAM_LECTURA se leen por bloques de TAM_BLOQUE.
+    Si un archivo comprimido no se puede descomprimir, se devuelve None.
+    """
+    abrir = DESCOMPRESORES.get(os.path.splitext(ruta_archivo)[1])
+    if abrir is not None:
+        try:
+            with io.TextIOWrapper(abrir(ruta_archivo), encoding="utf-8", errors="ignore") as f:
+                return _contar_lineas_flujo(f)
+        except ERRORES_DESCOMPRESION:
+            return None
+
     with open(ruta_archivo, "r", encoding="utf-8", errors="ignore") as f:
-        for linea in f:
-            if es_linea_valida(linea):
-                contador += 1
-    return contador
+        if os.fstat(f.fileno()).st_size > MAX_TAM_LECTURA:
+            return _contar_lineas_flujo(f)
+        return len(_PATRON_LINEA_VALIDA.findall("\n" + f.read()))
+
+
+def _firma_conteo() -> list:
+    """
+    Parámetros que afectan al conteo; si cambian, la caché deja de ser válida.
+    """
+    return [VERSION_CONTEO, IGNORE_COMMENTS, list(COMMENT_PREFIXES)]
+
+
+def cargar_cache(ruta_cache: str = _CACHE_PATH) -> Dict[str, list]:
+    """
+    Lee la caché de conteos de una ejecución anterior. Si no existe, está dañada
+    o se generó con otros criterios de conteo, se devuelve una caché vacía.
+    """
+    try:
+        with open(ruta_cache, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(datos, dict) or datos.get("firma") != _firma_conteo():
+        return {}
+    archivos = datos.get("archivos")
+    return archivos if isinstance(archivos, dict) else {}
+
+
+def guardar_cache(cache: Dict[str, list], ruta_cache: str = _CACHE_PATH) -> None:
+    """
+    Guarda la caché de conteos. Un fallo al escribirla no interrumpe el análisis.
+    """
+    try:
+        with open(ruta_cache, "w", encoding="utf-8") as f:
+            json.dump({"firma": _firma_conteo(), "archivos": cache}, f)
+    except OSError:
+        pass
+
+
+def _es_entrada_cache_valida(entrada) -> bool:
+    """
+    Una entrada de la caché es válida si es una lista [mtime_ns, tamaño, líneas] de enteros.
+    """
+    return (
+        isinstance(entrada, list)
+        and len(entrada) == 3
+        and all(type(v) is int for v in entrada)
+    )
+
+
+def contar_lineas_con_cache(ruta_archivo: str, cache: Dict[str, list]) -> list:
+    """
+    Devuelve [mtime_ns, tamaño, líneas] del archivo, reutilizando el conteo de la
+    caché si la fecha de modificación y el tamaño coinciden (basta con un stat).
+    Las entradas con otro formato se ignoran y el archivo se vuelve a contar.
+    'líneas' es None si el archivo no se pudo leer (ver contar_lineas_config).
+    """
+    st = os.stat(ruta_archivo)
+    entrada = cache.get(ruta_archivo)
+    if _es_entrada_cache_valida(entrada) and entrada[:2] == [st.st_mtime_ns, st.st_size]:
+        return entrada
+    return [st.st_mtime_ns, st.st_size, contar_lineas_config(ruta_archivo)]
+
+
+def es_archivo_config(nombre: str) -> bool:
+    """
+    Indica si el nombre tiene una extensión de configuración, directamente o
+    bajo un sufijo de compresión admitido (ej. 'pe1-mpls.cfg.gz').
+    """
+    base, ext = os.path.splitext(nombre)
+    if ext in DESCOMPRESORES:
+        ext = os.path.splitext(base)[1]
+    return ext in EXTENSIONS
 
 
 def obtener_archivos_config(directorio: str) -> List[str]:
     """
     Devuelve la lista de archivos de configuración en el directorio indicado
-    que coincidan con las extensiones definidas.
+    que coincidan con las extensiones definidas (también comprimidos).
     """
-    archivos = []
-
     # Si el usuario ha guardado archivos SIN extensión (ej. 'pe1-srv6')
     # también los recogemos comprobando ficheros "normales" sin filtrar por extensión.
-    for entrada in os.listdir(directorio):
-        ruta = os.path.join(directorio, entrada)
-        if os.path.isfile(ruta):
+    # os.scandir reutiliza el tipo de la entrada de directorio, evitando un stat por archivo.
+    with os.scandir(directorio) as entradas:
+        archivos = [
+            entrada.path
+            for entrada in entradas
             # Si la extensión está entre las permitidas (incluyendo cadena vacía)
-            _, ext = os.path.splitext(entrada)
-            if ext in EXTENSIONS:
-                archivos.append(ruta)
+            if entrada.is_file() and es_archivo_config(entrada.name)
+        ]
 
     # Si quieres, se podría complementar con glob, pero con lo anterior suele bastar.
     return sorted(archivos)
 
 
-def encontrar_referencia(resultados: List[Dict]) -> Optional[Dict]:
+@dataclass(slots=True)
+class ResultadoConfig:
+    """
+    Resultado del conteo de un archivo de configuración. Las diferencias frente
+    al mínimo y a la referencia no se guardan aquí: se calculan como columnas y
+    se escriben directamente en el informe y en el CSV.
+    """
+    archivo: str
+    lineas_codigo: int
+
+
+def encontrar_referencia(resultados: List[ResultadoConfig]) -> Optional[ResultadoConfig]:
     """
     Busca un archivo de referencia (por ejemplo, la configuración MPLS tradicional)
     usando la palabra clave REFERENCIA_KEYWORD en el nombre del archivo.
     """
-    for r in resultados:
-        if REFERENCIA_KEYWORD.lower() in r["archivo"].lower() and "srv" not in r["archivo"].lower():
-            return r
-    return None
+    return next((r for r in resultados if _PATRON_REFERENCIA.match(r.archivo)), None)
 
 
-def guardar_csv(resultados: List[Dict], nombre_csv: str = "resumen_configuraciones.csv") -> None:
+def calcular_diferencias(lineas: List[int], base: int) -> Tuple[List[int], List[float]]:
+    """
+    Calcula, para cada conteo de líneas, la diferencia absoluta y porcentual
+    (redondeada a 2 decimales) respecto a 'base'.
+    """
+    diff_abs = [l - base for l in lineas]
+    diff_pct = [round(d / base * 100, 2) if base > 0 else 0.0 for d in diff_abs]
+    return diff_abs, diff_pct
+
+
+# Columnas del CSV de resultados
+CAMPOS_CSV = (
+    "archivo",
+    "lineas_codigo",
+    "diff_vs_min_abs",
+    "diff_vs_min_pct",
+    "diff_vs_ref_abs",
+    "diff_vs_ref_pct",
+)
+
+
+def guardar_csv(filas: Iterable[Sequence], nombre_csv: str = "resumen_configuraciones.csv") -> None:
     """
     Guarda los resultados en un archivo CSV para uso posterior en tablas o gráficos.
+
+    Cada fila es una secuencia de valores en el orden de CAMPOS_CSV (None queda
+    vacío). Las filas se escriben con una sola llamada a writerows sobre un
+    archivo con búfer de TAM_BUFFER_CSV bytes; csv.writer se encarga de
+    entrecomillar los nombres de archivo que contengan ';' o comillas.
     """
-    campos = [
-        "archivo",
-        "lineas_codigo",
-        "diff_vs_min_abs",
-        "diff_vs_min_pct",
-        "diff_vs_ref_abs",
-        "diff_vs_ref_pct"
-    ]
+    with open(nombre_csv, "w", newline="", encoding="utf-8", buffering=TAM_BUFFER_CSV) as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(CAMPOS_CSV)
+        writer.writerows(filas)
 
-    with open(nombre_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=campos, delimiter=";")
-        writer.writeheader()
-        for r in resultados:
-            writer.writerow(r)
+
+# Formatos de las líneas repetidas por archivo en el informe de consola
+# (métodos format ya enlazados, reutilizados en cada fila)
+_FMT_CONTEO = "{:35s} -> {:5d} líneas de código".format
+_FMT_VS_MIN = "- {:20s}: {:4d} líneas  | +{:3d} vs mín ({:6.2f} %)".format
+_FMT_VS_REF = "- {:20s}: {:4d} líneas  | {}{:4d} líneas vs ref ({:6.2f} %)".format
 
 
 def main():
     if not os.path.isdir(CONFIG_DIR):
-        print(f"[ERROR] La carpeta de configuraciones no existe: {CONFIG_DIR}")
-        print("Cree la carpeta y coloque dentro los archivos de configuración.")
+        sys.stdout.write(
+            f"[ERROR] La carpeta de configuraciones no existe: {CONFIG_DIR}\n"
+            "Cree la carpeta y coloque dentro los archivos de configuración.\n"
+        )
         return
 
     archivos = obtener_archivos_config(CONFIG_DIR)
 
     if not archivos:
-        print(f"[AVISO] No se encontraron archivos de configuración en: {CONFIG_DIR}")
+        sys.stdout.write(f"[AVISO] No se encontraron archivos de configuración en: {CONFIG_DIR}\n")
         return
 
-    resultados: List[Dict] = []
+    resultados: List[ResultadoConfig] = []
 
-    print("Evaluación de complejidad de configuraciones (líneas de código):")
-    print("-" * 80)
+    # Todo el informe se acumula en 'salida' y se escribe en la consola de una sola vez al final
+    salida: List[str] = [
+        "Evaluación de complejidad de configuraciones (líneas de código):",
+        "-" * 80,
+    ]
 
-    # 1. Conteo de líneas por archivo
-    for ruta in archivos:
+    # 1. Conteo de líneas por archivo (en hilos; map conserva el orden de 'archivos').
+    #    Los archivos sin cambios desde la ejecución anterior se toman de la caché.
+    cache = cargar_cache()
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(archivos))) as executor:
+        entradas = list(executor.map(partial(contar_lineas_con_cache, cache=cache), archivos))
+    cache_nueva = {ruta: e for ruta, e in zip(archivos, entradas) if e[2] is not None}
+    # Sin cambios respecto a la caché leída, no se reescribe el archivo
+    if cache_nueva != cache:
+        guardar_cache(cache_nueva)
+
+    for ruta, (_, _, num_lineas) in zip(archivos, entradas):
         nombre = os.path.basename(ruta)
-        num_lineas = contar_lineas_config(ruta)
-        resultados.append(
-            {
-                "archivo": nombre,
-                "lineas_codigo": num_lineas,
-                # Estos campos se llenarán luego
-                "diff_vs_min_abs": None,
-                "diff_vs_min_pct": None,
-                "diff_vs_ref_abs": None,
-                "diff_vs_ref_pct": None,
-            }
-        )
-        print(f"{nombre:35s} -> {num_lineas:5d} líneas de código")
+        # Un archivo comprimido ilegible se omite sin interrumpir el resto del informe
+        if num_lineas is None:
+            salida.append(f"[AVISO] No se pudo descomprimir {nombre}; se omite del análisis.")
+            continue
+        resultados.append(ResultadoConfig(nombre, num_lineas))
+        salida.append(_FMT_CONTEO(nombre, num_lineas))
+
+    salida.append("-" * 80)
+
+    if not resultados:
+        salida.append(f"[AVISO] No se pudo analizar ningún archivo de configuración en: {CONFIG_DIR}")
+        sys.stdout.write("\n".join(salida) + "\n")
+        return
 
-    print("-" * 80)
+    # 2. Extremos en una sola pasada (ante empates, max sobre la lista invertida
+    #    devuelve el mismo archivo que el último elemento del orden estable)
+    clave_lineas = attrgetter("lineas_codigo")
+    mas_simple = min(resultados, key=clave_lineas)
+    mas_complejo = max(reversed(resultados), key=clave_lineas)
 
-    # 2. Ordenar por número de líneas (de menor a mayor)
-    resultados_ordenados = sorted(resultados, key=lambda x: x["lineas_codigo"])
-    mas_simple = resultados_ordenados[0]
-    mas_complejo = resultados_ordenados[-1]
+    min_lineas = mas_simple.lineas_codigo
+    max_lineas = mas_complejo.lineas_codigo
 
-    min_lineas = mas_simple["lineas_codigo"]
-    max_lineas = mas_complejo["lineas_codigo"]
+    # Orden de menor a mayor, usado para la impresión, el CSV y la búsqueda de la referencia
+    resultados_ordenados = sorted(resultados, key=clave_lineas)
+    conteos_ordenados = list(map(clave_lineas, resultados_ordenados))
 
     # 3. Buscar referencia (ej. MPLS tradicional)
     referencia = encontrar_referencia(resultados_ordenados)
+
+    # 4. Diferencias vs mínimo y vs referencia (sin referencia, las columnas quedan vacías)
+    diff_min_abs, diff_min_pct = calcular_diferencias(conteos_ordenados, min_lineas)
     if referencia:
-        ref_lineas = referencia["lineas_codigo"]
+        diff_ref_abs, diff_ref_pct = calcular_diferencias(conteos_ordenados, referencia.lineas_codigo)
     else:
-        ref_lineas = None
-
-    # 4. Calcular diferencias vs mínimo y vs referencia
-    for r in resultados_ordenados:
-        lineas = r["lineas_codigo"]
-
-        # Diferencia absoluta y porcentual respecto a la configuración más simple
-        diff_min_abs = lineas - min_lineas
-        diff_min_pct = (diff_min_abs / min_lineas * 100) if min_lineas > 0 else 0.0
-
-        r["diff_vs_min_abs"] = diff_min_abs
-        r["diff_vs_min_pct"] = round(diff_min_pct, 2)
-
-        # Diferencia respecto a referencia (si existe)
-        if ref_lineas is not None:
-            diff_ref_abs = lineas - ref_lineas
-            diff_ref_pct = (diff_ref_abs / ref_lineas * 100) if ref_lineas > 0 else 0.0
-            r["diff_vs_ref_abs"] = diff_ref_abs
-            r["diff_vs_ref_pct"] = round(diff_ref_pct, 2)
-
-    # 5. Impresión del resumen comparativo
-    print("\nResumen ordenado por complejidad (menos a más líneas):")
-    for r in resultados_ordenados:
-        print(
-            f"- {r['archivo']:20s}: "
-            f"{r['lineas_codigo']:4d} líneas  | "
-            f"+{r['diff_vs_min_abs']:3d} vs mín "
-            f"({r['diff_vs_min_pct']:6.2f} %)"
-        )
-
-    print("\nConfiguración con menor número de líneas (más sencilla de implementar):")
-    print(f"> {mas_simple['archivo']} con {mas_simple['lineas_codigo']} líneas de código.")
-
-    print("\nConfiguración con mayor número de líneas (más compleja):")
-    print(f"> {mas_complejo['archivo']} con {mas_complejo['lineas_codigo']} líneas de código.")
+        diff_ref_abs = diff_ref_pct = [None] * len(resultados_ordenados)
+
+    # 5. Un único recorrido en orden: cada archivo se formatea para el resumen y
+    #    su fila para el CSV en cuanto se conocen sus diferencias.
+    salida.append("\nResumen ordenado por complejidad (menos a más líneas):")
+    comparacion_ref: List[str] = []
+    filas: List[Tuple] = []
+    for r, d_min, p_min, d_ref, p_ref in zip(
+        resultados_ordenados, diff_min_abs, diff_min_pct, diff_ref_abs, diff_ref_pct
+    ):
+        salida.append(_FMT_VS_MIN(r.archivo, r.lineas_codigo, d_min, p_min))
+        if d_ref is not None:
+            signo = "+" if d_ref >= 0 else ""
+            comparacion_ref.append(_FMT_VS_REF(r.archivo, r.lineas_codigo, signo, d_ref, p_ref))
+        filas.append((r.archivo, r.lineas_codigo, d_min, p_min, d_ref, p_ref))
+
+    salida.append("\nConfiguración con menor número de líneas (más sencilla de implementar):")
+    salida.append(f"> {mas_simple.archivo} con {mas_simple.lineas_codigo} líneas de código.")
+
+    salida.append("\nConfiguración con mayor número de líneas (más compleja):")
+    salida.append(f"> {mas_complejo.archivo} con {mas_complejo.lineas_codigo} líneas de código.")
 
     # Diferencia entre extremos
     diff_extremos = max_lineas - min_lineas
     diff_extremos_pct = (diff_extremos / max_lineas * 100) if max_lineas > 0 else 0.0
-    print(
+    salida.append(
         f"\nDiferencia entre la configuración más simple y la más compleja: "
         f"{diff_extremos} líneas "
         f"({diff_extremos_pct:.2f} % del archivo más complejo)."
@@ -219,24 +434,20 @@ def main():
 
     # Resumen respecto a referencia (si la hay)
     if referencia:
-        print("\nArchivo de referencia identificado (ej. MPLS tradicional):")
-        print(f"> {referencia['archivo']} con {referencia['lineas_codigo']} líneas.")
-        print("Comparación frente a la referencia:")
-        for r in resultados_ordenados:
-            if r["diff_vs_ref_abs"] is None:
-                continue
-            signo = "+" if r["diff_vs_ref_abs"] >= 0 else ""
-            print(
-                f"- {r['archivo']:20s}: {r['lineas_codigo']:4d} líneas  | "
-                f"{signo}{r['diff_vs_ref_abs']:4d} líneas vs ref "
-                f"({r['diff_vs_ref_pct']:6.2f} %)"
-            )
+        salida.append("\nArchivo de referencia identificado (ej. MPLS tradicional):")
+        salida.append(f"> {referencia.archivo} con {referencia.lineas_codigo} líneas.")
+        salida.append("Comparación frente a la referencia:")
+        salida.extend(comparacion_ref)
     else:
-        print("\n[Nota] No se identificó un archivo de referencia que contenga la palabra 'mpls' sin 'srv'.")
-
-    # 6. Guardar resultados en CSV
-    guardar_csv(resultados_ordenados)
-    print("\nSe ha generado el archivo 'resumen_configuraciones.csv' con el detalle de los resultados.")
+        salida.append("\n[Nota] No se identificó un archivo de referencia que contenga la palabra 'mpls' sin 'srv'.")
+
+    # 6. Guardar resultados en CSV. El informe se escribe aunque falle el CSV
+    #    (ej. si el archivo está abierto en otro programa).
+    try:
+        guardar_csv(filas)
+    finally:
+        sys.stdout.write("\n".join(salida) + "\n")
+    sys.stdout.write("\nSe ha generado el archivo 'resumen_configuraciones.csv' con el detalle de los resultados.\n")
 
 
 if __name__ == "__main__":